@@ -0,0 +1,51 @@
+from collections import OrderedDict
+
+from django.core.paginator import Paginator
+from rest_framework.pagination import CursorPagination, PageNumberPagination
+from rest_framework.response import Response
+
+
+class PubDateCursorPagination(CursorPagination):
+    """
+    Пагинация по курсору для лент отзывов и комментариев.\n
+    Страница выбирается по дате публикации, а не через OFFSET.
+    Поле count оставлено в ответе ради совместимости с остальными
+    эндпоинтами API, но считается только для первой страницы
+    (без параметра cursor); на следующих страницах оно равно None.
+    """
+    ordering = '-pub_date'
+
+    def paginate_queryset(self, queryset, request, view=None):
+        self.count = None
+        if not request.query_params.get(self.cursor_query_param):
+            self.count = queryset.count()
+        return super().paginate_queryset(queryset, request, view)
+
+    def get_paginated_response(self, data):
+        return Response(OrderedDict([
+            ('count', self.count),
+            ('next', self.get_next_link()),
+            ('previous', self.get_previous_link()),
+            ('results', data)
+        ]))
+
+
+class LookupTablePaginator(Paginator):
+    """
+    Пагинатор для небольших справочников.\n
+    Первая страница запрашивается с одним лишним объектом: если он
+    не вернулся, все объекты уже получены и COUNT(*) не выполняется.
+    Иначе количество считается лениво, при первом обращении к count.
+    """
+
+    def page(self, number):
+        if number in (1, '1'):
+            objects = list(self.object_list[:self.per_page + 1])
+            if len(objects) <= self.per_page:
+                self.count = len(objects)
+            return self._get_page(objects[:self.per_page], 1, self)
+        return super().page(number)
+
+
+class LookupTablePagination(PageNumberPagination):
+    django_paginator_class = LookupTablePaginator
@@ -18,7 +18,7 @@ class IsResponsibleUserOrReadOnly(permissions.IsAuthenticatedOrReadOnly):
         return bool(
             request.method in permissions.SAFE_METHODS
             or (
-                obj.author == request.user
+                obj.author_id == request.user.id
                 or request.user.is_moderator
                 or request.user.is_staff
             )
@@ -1,11 +1,53 @@
-import datetime
-
 from django.contrib.auth.validators import UnicodeUsernameValidator
-from django.db.models import Q
+from django.db.models import F, Q
 from rest_framework import serializers
 from rest_framework.exceptions import ValidationError
 from rest_framework.validators import UniqueValidator
 from reviews.models import Review, Comment, User, Category, Genre, Title
+from reviews.validators import current_year
+
+_USERNAME_VALIDATOR = UnicodeUsernameValidator()
+
+
+class SerializerCacheMixin:
+    """
+    Миксин сериализатора.\n
+    Кеширует представление объекта в рамках одного запроса,
+    чтобы объект, встречающийся в ответе несколько раз
+    (например, жанр у разных произведений), сериализовался однажды.
+    """
+
+    def to_representation(self, instance):
+        if instance.pk is None:
+            return super().to_representation(instance)
+        cache = self.context.setdefault('representation_cache', {})
+        key = (type(self), instance.pk)
+        if key not in cache:
+            cache[key] = super().to_representation(instance)
+        return cache[key]
+
+
+class EagerLoadingMixin:
+    """
+    Миксин сериализатора.\n
+    Описывает связанные объекты и аннотации, которые нужно загрузить
+    заранее. Вьюсет передает свой queryset в setup_eager_loading().
+    """
+    select_related_fields = ()
+    prefetch_related_fields = ()
+    annotate_fields = {}
+
+    @classmethod
+    def setup_eager_loading(cls, queryset):
+        if cls.select_related_fields:
+            queryset = queryset.select_related(*cls.select_related_fields)
+        if cls.prefetch_related_fields:
+            queryset = queryset.prefetch_related(
+                *cls.prefetch_related_fields
+            )
+        if cls.annotate_fields:
+            queryset = queryset.annotate(**cls.annotate_fields)
+        return queryset
 
 
 class SignUpSerializer(serializers.ModelSerializer):
@@ -13,7 +55,7 @@ class SignUpSerializer(serializers.ModelSerializer):
     username = serializers.CharField(
         max_length=150,
         validators=[
-            UnicodeUsernameValidator(),
+            _USERNAME_VALIDATOR,
         ]
     )
 
@@ -52,7 +94,7 @@ class SignUpSerializer(serializers.ModelSerializer):
 class RecieveTokenSerializer(serializers.Serializer):
     username = serializers.CharField(
         max_length=150,
-        validators=[UnicodeUsernameValidator()],
+        validators=[_USERNAME_VALIDATOR],
     )
     confirmation_code = serializers.CharField()
 
@@ -60,12 +102,15 @@ class RecieveTokenSerializer(serializers.Serializer):
 class UserSerializer(serializers.ModelSerializer):
     username = serializers.CharField(
         max_length=150,
-        validators=[UnicodeUsernameValidator()],
-    )
-    email = serializers.EmailField(
-        max_length=254,
-        validators=[UniqueValidator(queryset=User.objects.all())]
+        validators=[
+            _USERNAME_VALIDATOR,
+            UniqueValidator(
+                queryset=User.objects.all(),
+                message='Данное имя пользователя уже используется.'
+            ),
+        ],
     )
+    email = serializers.EmailField(max_length=254)
     first_name = serializers.CharField(max_length=150, required=False)
     last_name = serializers.CharField(max_length=150, required=False)
     bio = serializers.CharField(required=False)
@@ -79,25 +124,15 @@ class UserSerializer(serializers.ModelSerializer):
         lookup_field = 'username'
         extra_kwargs = {'url': {'lookup_field': 'username'}}
 
-    def validate_username(self, value):
-        if (
-            self.context['request'].method == 'POST'
-            and User.objects.filter(username=value).exists()
-        ):
-            raise serializers.ValidationError(
-                {'username': 'Данное имя пользователя уже используется.'}
-            )
-        return value
-
 
-class CategorySerializer(serializers.ModelSerializer):
+class CategorySerializer(SerializerCacheMixin, serializers.ModelSerializer):
     class Meta:
         model = Category
         fields = ('name', 'slug')
         lookup_field = 'slug'
 
 
-class GenreSerializer(serializers.ModelSerializer):
+class GenreSerializer(SerializerCacheMixin, serializers.ModelSerializer):
     class Meta:
         model = Genre
         fields = ('name', 'slug')
@@ -124,15 +159,18 @@ class TitleSerializer(serializers.ModelSerializer):
         read_only_fields = ('id',)
 
     def validate_year(self, value):
-        year = datetime.date.today().year
-        if year < value:
+        if current_year() < value:
             raise serializers.ValidationError(
                 "Год выпуска не может быть больше текущего"
             )
         return value
 
 
-class TitleReadOnlySerializer(serializers.ModelSerializer):
+class TitleReadOnlySerializer(
+    EagerLoadingMixin, SerializerCacheMixin, serializers.ModelSerializer
+):
+    select_related_fields = ('category',)
+    prefetch_related_fields = ('genre',)
     category = CategorySerializer(read_only=True)
     genre = GenreSerializer(read_only=True, many=True)
     rating = serializers.IntegerField(read_only=True)
@@ -143,10 +181,11 @@ class TitleReadOnlySerializer(serializers.ModelSerializer):
                   'genre', 'category', 'rating')
 
 
-class ReviewSerializer(serializers.ModelSerializer):
-    author = serializers.SlugRelatedField(
-        slug_field='username', read_only=True
-    )
+class ReviewSerializer(
+    EagerLoadingMixin, SerializerCacheMixin, serializers.ModelSerializer
+):
+    annotate_fields = {'author_username': F('author__username')}
+    author = serializers.CharField(source='author_username', read_only=True)
 
     class Meta:
         fields = ('id', 'text', 'author', 'score', 'pub_date')
@@ -154,11 +193,11 @@ class ReviewSerializer(serializers.ModelSerializer):
         model = Review
 
     def validate(self, data):
-        title_id = self.context['view'].kwargs['title_id']
+        view = self.context['view']
         if (
-            self.context['view'].action == 'create'
+            view.action == 'create'
             and Review.objects.filter(
-                title=title_id,
+                title_id=view.kwargs['title_id'],
                 author=self.context['request'].user
             ).exists()
         ):
@@ -166,10 +205,11 @@ class ReviewSerializer(serializers.ModelSerializer):
         return data
 
 
-class CommentSerializer(serializers.ModelSerializer):
-    author = serializers.SlugRelatedField(
-        slug_field='username', read_only=True
-    )
+class CommentSerializer(
+    EagerLoadingMixin, SerializerCacheMixin, serializers.ModelSerializer
+):
+    annotate_fields = {'author_username': F('author__username')}
+    author = serializers.CharField(source='author_username', read_only=True)
 
     class Meta:
         fields = ('id', 'text', 'author', 'pub_date')
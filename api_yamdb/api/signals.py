@@ -0,0 +1,29 @@
+from django.conf import settings
+from django.core.cache import cache
+from django.db.models.signals import post_delete, post_save
+from django.dispatch import receiver
+
+from reviews.models import Category, Genre
+from .views import CategoryViewSet, GenreViewSet
+
+
+def invalidate_list_cache(version_key):
+    """Увеличивает версию кешированного списка справочника."""
+    if not settings.LOOKUP_LIST_CACHE:
+        return
+    try:
+        cache.incr(version_key)
+    except ValueError:
+        cache.set(version_key, 1, timeout=None)
+
+
+@receiver(post_save, sender=Category)
+@receiver(post_delete, sender=Category)
+def invalidate_categories_list(sender, **kwargs):
+    invalidate_list_cache(CategoryViewSet.cache_version_key)
+
+
+@receiver(post_save, sender=Genre)
+@receiver(post_delete, sender=Genre)
+def invalidate_genres_list(sender, **kwargs):
+    invalidate_list_cache(GenreViewSet.cache_version_key)
@@ -0,0 +1,16 @@
+from celery import shared_task
+from django.core.mail import send_mail
+
+
+@shared_task
+def send_confirmation_email(username, email, confirmation_code):
+    send_mail(
+        subject='Yamdb registration success.',
+        message=(
+            f'Регистрация пользователя {username} прошла успешно.\n'
+            f'Код подтверждения: {confirmation_code}'
+        ),
+        from_email='Yamdb@yandex.ru',
+        recipient_list=[email],
+        fail_silently=False
+    )
@@ -1,23 +1,30 @@
+from hashlib import sha256
+
+from django.conf import settings
 from django.contrib.auth.tokens import default_token_generator
-from django.core.mail import send_mail
-from django.db.models import Avg
+from django.core.cache import cache
+from django.db import IntegrityError, transaction
+from django.http import Http404
 from django.shortcuts import get_object_or_404
-from django_filters.rest_framework import DjangoFilterBackend
 from rest_framework import filters, mixins, permissions, status, viewsets
 from rest_framework.decorators import action, api_view, permission_classes
+from rest_framework.exceptions import ValidationError
 from rest_framework.response import Response
 from rest_framework_simplejwt.tokens import AccessToken
 from rest_framework.pagination import PageNumberPagination
 
-from reviews.models import User, Genre, Title, Category, Review
+from reviews.models import User, Genre, Title, Category, Review, Comment
 from .decorators import not_allowed_put_method
-from .filters import TitleFilterSet
+from .pagination import LookupTablePagination, PubDateCursorPagination
 from .permissions import IsAdminOrReadOnly, IsResponsibleUserOrReadOnly
 from .serializers import (
     SignUpSerializer, RecieveTokenSerializer, UserSerializer,
     CategorySerializer, GenreSerializer, TitleSerializer,
     TitleReadOnlySerializer, ReviewSerializer, CommentSerializer
 )
+from .tasks import send_confirmation_email
+
+LOOKUP_LIST_CACHE_TIMEOUT = 60 * 15
 
 
 @api_view(['POST'])
@@ -25,17 +32,19 @@ from .serializers import (
 def sign_up(request):
     serializer = SignUpSerializer(data=request.data)
     if serializer.is_valid():
-        user, _ = User.objects.get_or_create(**serializer.validated_data)
+        try:
+            user = (
+                User.objects.filter(**serializer.validated_data).first()
+                or User.objects.create(**serializer.validated_data)
+            )
+        except IntegrityError:
+            return Response(
+                {'username': 'Имя пользователя или почта уже используются.'},
+                status=status.HTTP_400_BAD_REQUEST
+            )
         confirmation_code = default_token_generator.make_token(user)
-        send_mail(
-            subject='Yamdb registration success.',
-            message=(
-                f'Регистрация пользователя {user.username} прошла успешно.\n'
-                f'Код подтверждения: {confirmation_code}'
-            ),
-            from_email='Yamdb@yandex.ru',
-            recipient_list=[user.email],
-            fail_silently=False
+        send_confirmation_email.delay(
+            user.username, user.email, confirmation_code
         )
         return Response(serializer.data, status=status.HTTP_200_OK)
     return Response(serializer.errors, status=status.HTTP_400_BAD_REQUEST)
@@ -68,6 +77,47 @@ class UserViewSet(viewsets.ModelViewSet):
     filter_backends = (filters.SearchFilter,)
     search_fields = ('username',)
 
+    def get_queryset(self):
+        if self.action == 'list':
+            return self.queryset.only(*UserSerializer.Meta.fields)
+        return self.queryset
+
+    @staticmethod
+    def save_user(serializer):
+        """
+        Сохраняет пользователя.\n
+        Нарушение уникальности в базе превращается в ошибку валидации
+        поля, значение которого уже занято.
+        """
+        try:
+            with transaction.atomic():
+                serializer.save()
+        except IntegrityError:
+            data = serializer.validated_data
+            others = User.objects.all()
+            if serializer.instance is not None:
+                others = others.exclude(pk=serializer.instance.pk)
+            if 'email' in data and others.filter(email=data['email']).exists():
+                raise ValidationError({'email': [
+                    'Данный адрес электронной почты уже используется.'
+                ]})
+            if (
+                'username' in data
+                and others.filter(username=data['username']).exists()
+            ):
+                raise ValidationError({'username': [
+                    'Данное имя пользователя уже используется.'
+                ]})
+            raise ValidationError({'non_field_errors': [
+                'Имя пользователя или почта уже используются.'
+            ]})
+
+    def perform_create(self, serializer):
+        self.save_user(serializer)
+
+    def perform_update(self, serializer):
+        self.save_user(serializer)
+
     @action(
         detail=False,
         methods=['GET', 'PATCH'],
@@ -96,7 +146,7 @@ class UserViewSet(viewsets.ModelViewSet):
             partial=True
         )
         if serializer.is_valid():
-            serializer.save()
+            self.save_user(serializer)
             return Response(serializer.data, status=status.HTTP_200_OK)
         return Response(serializer.errors, status=status.HTTP_400_BAD_REQUEST)
 
@@ -106,37 +156,111 @@ class CreateListDestroyViewSet(
         mixins.ListModelMixin,
         mixins.DestroyModelMixin,
         viewsets.GenericViewSet):
-    pass
+    """
+    Вьюсет справочника.\n
+    Если включен LOOKUP_LIST_CACHE, ответ на запрос списка кешируется.
+    Ключ кеша содержит версию, которая увеличивается при любом
+    сохранении и удалении объектов (см. api.signals).
+    """
+    cache_version_key = None
+
+    def get_list_cache_key(self):
+        """
+        Ключ кеша строится только из параметров, меняющих ответ.
+        Для запросов с другими параметрами возвращается None.
+        """
+        params = self.request.query_params
+        cached_params = (
+            self.paginator.page_query_param, filters.SearchFilter.search_param
+        )
+        if set(params) - set(cached_params):
+            return None
+        version = cache.get_or_set(self.cache_version_key, 1, timeout=None)
+        # Схема и хост входят в ключ: от них зависят ссылки next/previous.
+        request_key = sha256('\n'.join((
+            self.request.scheme,
+            self.request.get_host(),
+            *(params.get(name, '') for name in cached_params)
+        )).encode()).hexdigest()
+        return f'{self.cache_version_key}:{version}:{request_key}'
+
+    def list(self, request, *args, **kwargs):
+        """
+        Список справочника без сериализации каждого объекта.\n
+        Поля сериализатора читаются из базы напрямую через values().
+        """
+        cache_key = (
+            self.get_list_cache_key() if settings.LOOKUP_LIST_CACHE else None
+        )
+        if cache_key is None:
+            return self.get_list_response()
+        data = cache.get(cache_key)
+        if data is not None:
+            return Response(data)
+        response = self.get_list_response()
+        cache.set(cache_key, response.data, LOOKUP_LIST_CACHE_TIMEOUT)
+        return response
+
+    def get_list_response(self):
+        queryset = self.filter_queryset(self.get_queryset()).values(
+            *self.get_serializer_class().Meta.fields
+        )
+        page = self.paginate_queryset(queryset)
+        if page is not None:
+            return self.get_paginated_response(page)
+        return Response(list(queryset))
 
 
 class CategoryViewSet(CreateListDestroyViewSet):
-    queryset = Category.objects.all()
+    queryset = Category.objects.only('name', 'slug')
+    cache_version_key = 'categories_version'
     serializer_class = CategorySerializer
     permission_classes = (IsAdminOrReadOnly,)
-    pagination_class = PageNumberPagination
+    pagination_class = LookupTablePagination
     filter_backends = (filters.SearchFilter,)
     lookup_field = 'slug'
+    lookup_value_regex = r'[-a-zA-Z0-9_]+'
     search_fields = ('name',)
 
 
 class GenreViewSet(CreateListDestroyViewSet):
-    queryset = Genre.objects.all()
+    queryset = Genre.objects.only('name', 'slug')
+    cache_version_key = 'genres_version'
     serializer_class = GenreSerializer
     permission_classes = (IsAdminOrReadOnly,)
-    pagination_class = PageNumberPagination
+    pagination_class = LookupTablePagination
     filter_backends = (filters.SearchFilter,)
     lookup_field = 'slug'
+    lookup_value_regex = r'[-a-zA-Z0-9_]+'
     search_fields = ('name',)
 
 
 class TitleViewSet(viewsets.ModelViewSet):
-    queryset = Title.objects.annotate(rating=Avg('reviews__score'))
+    queryset = Title.objects.all()
     permission_classes = (IsAdminOrReadOnly,)
     pagination_class = PageNumberPagination
-    filter_backends = (DjangoFilterBackend,)
-    filterset_class = TitleFilterSet
+    lookup_value_regex = r'\d+'
     ordering = ('name',)
 
+    def get_queryset(self):
+        queryset = TitleReadOnlySerializer.setup_eager_loading(
+            super().get_queryset()
+        )
+        params = self.request.query_params
+        if params.get('category'):
+            queryset = queryset.filter(category__slug=params['category'])
+        if params.get('genre'):
+            queryset = queryset.filter(genre__slug=params['genre'])
+        if params.get('year'):
+            try:
+                year = int(params['year'])
+            except ValueError:
+                raise ValidationError({'year': 'Введите число.'})
+            queryset = queryset.filter(year=year)
+        if params.get('name'):
+            queryset = queryset.filter(name=params['name'])
+        return queryset
+
     def get_serializer_class(self):
         if self.request.method == 'GET':
             return TitleReadOnlySerializer
@@ -147,39 +271,51 @@ class TitleViewSet(viewsets.ModelViewSet):
 class ReviewViewSet(viewsets.ModelViewSet):
     serializer_class = ReviewSerializer
     permission_classes = (IsResponsibleUserOrReadOnly,)
+    pagination_class = PubDateCursorPagination
+    lookup_value_regex = r'\d+'
 
-    def get_queryset(self):
+    def get_title_id(self):
         title_id = self.kwargs.get('title_id')
-        title = get_object_or_404(Title, id=title_id)
-        queryset = title.reviews.select_related('author').all()
-        return queryset
+        if not Title.objects.filter(pk=title_id).exists():
+            raise Http404
+        return title_id
+
+    def get_queryset(self):
+        return self.serializer_class.setup_eager_loading(
+            Review.objects.filter(title_id=self.get_title_id())
+        ).order_by('-pub_date')
 
     def perform_create(self, serializer):
-        title_id = self.kwargs.get('title_id')
-        title = get_object_or_404(Title, id=title_id)
-        serializer.save(
+        review = serializer.save(
             author=self.request.user,
-            title=title
+            title_id=self.get_title_id()
         )
+        review.author_username = self.request.user.username
 
 
 @not_allowed_put_method
 class CommentViewSet(viewsets.ModelViewSet):
     serializer_class = CommentSerializer
     permission_classes = (IsResponsibleUserOrReadOnly,)
+    pagination_class = PubDateCursorPagination
+    lookup_value_regex = r'\d+'
 
-    def get_queryset(self):
-        title_id = self.kwargs.get('title_id')
+    def get_review_id(self):
         review_id = self.kwargs.get('review_id')
-        review = get_object_or_404(Review, id=review_id, title=title_id)
-        queryset = review.comments.select_related('author').all()
-        return queryset
+        if not Review.objects.filter(
+            pk=review_id, title_id=self.kwargs.get('title_id')
+        ).exists():
+            raise Http404
+        return review_id
+
+    def get_queryset(self):
+        return self.serializer_class.setup_eager_loading(
+            Comment.objects.filter(review_id=self.get_review_id())
+        ).order_by('-pub_date')
 
     def perform_create(self, serializer):
-        title_id = self.kwargs.get('title_id')
-        review_id = self.kwargs.get('review_id')
-        review = get_object_or_404(Review, id=review_id, title=title_id)
-        serializer.save(
+        comment = serializer.save(
             author=self.request.user,
-            review=review
+            review_id=self.get_review_id()
         )
+        comment.author_username = self.request.user.username
@@ -1,3 +1,4 @@
+import os
 from datetime import timedelta
 from pathlib import Path
 
@@ -22,7 +23,6 @@ INSTALLED_APPS = [
     'django.contrib.sessions',
     'django.contrib.messages',
     'django.contrib.staticfiles',
-    'django_filters',
     'rest_framework',
     'rest_framework_simplejwt',
     'api.apps.ApiConfig',
@@ -124,6 +124,42 @@ EMAIL_FILE_PATH = BASE_DIR / 'api/sent_emails'
 DEFAULT_FROM_EMAIL = 'yamdb@yandex.ru'
 
 
+# Cache settings
+
+REDIS_URL = os.getenv('REDIS_URL')
+
+if REDIS_URL:
+    CACHES = {
+        'default': {
+            'BACKEND': 'django_redis.cache.RedisCache',
+            'LOCATION': REDIS_URL,
+        }
+    }
+
+# Кеш списков категорий и жанров сбрасывается по версии, поэтому
+# он включается только с общим для всех процессов кешем (Redis).
+LOOKUP_LIST_CACHE = bool(REDIS_URL)
+
+
+# Celery settings
+
+CELERY_BROKER_URL = os.getenv(
+    'CELERY_BROKER_URL', 'redis://localhost:6379/0'
+)
+
+CELERY_TASK_ROUTES = {
+    'api.tasks.send_confirmation_email': {'queue': 'email_queue'},
+}
+
+# По умолчанию задачи выполняются сразу, без брокера.
+# Для работы с воркером задайте CELERY_TASK_ALWAYS_EAGER=False.
+CELERY_TASK_ALWAYS_EAGER = (
+    os.getenv('CELERY_TASK_ALWAYS_EAGER', 'True').lower() == 'true'
+)
+
+CELERY_TASK_EAGER_PROPAGATES = True
+
+
 # Rest framework settings
 
 REST_FRAMEWORK = {
@@ -0,0 +1,35 @@
+from django.db import migrations, models
+from django.db.models import Avg, Count
+
+
+def fill_title_rating(apps, schema_editor):
+    Title = apps.get_model('reviews', 'Title')
+    for title in Title.objects.annotate(
+        review_rating=Avg('reviews__score'),
+        review_count=Count('reviews')
+    ).iterator():
+        Title.objects.filter(pk=title.pk).update(
+            rating=title.review_rating,
+            reviews_count=title.review_count
+        )
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('reviews', '0001_initial'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='title',
+            name='rating',
+            field=models.FloatField(blank=True, editable=False, null=True, verbose_name='Рейтинг'),
+        ),
+        migrations.AddField(
+            model_name='title',
+            name='reviews_count',
+            field=models.PositiveIntegerField(default=0, editable=False, verbose_name='Количество отзывов'),
+        ),
+        migrations.RunPython(fill_title_rating, migrations.RunPython.noop),
+    ]
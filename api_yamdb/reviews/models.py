@@ -71,11 +71,27 @@ class Title(models.Model):
         null=True, blank=True,
         verbose_name='Категория'
     )
+    rating = models.FloatField(
+        verbose_name='Рейтинг',
+        null=True, blank=True,
+        editable=False
+    )
+    reviews_count = models.PositiveIntegerField(
+        verbose_name='Количество отзывов',
+        default=0,
+        editable=False
+    )
 
     class Meta:
         ordering = ['name']
         verbose_name = 'Произведение'
         verbose_name_plural = 'Произведения'
+        indexes = [
+            models.Index(
+                fields=['year', 'category'],
+                name='title_year_category_idx'
+            ),
+        ]
 
     def __str__(self):
         return self.name
@@ -144,7 +160,12 @@ class Review(models.Model):
                 name='unique_title_author_review'
             ),
         ]
-        ordering = ['-pub_date']
+        indexes = [
+            models.Index(
+                fields=['title', '-pub_date'],
+                name='review_title_pub_date_idx'
+            ),
+        ]
 
     def __str__(self):
         return self.text
@@ -174,6 +195,12 @@ class Comment(models.Model):
         ordering = ['-pub_date']
         verbose_name = 'Комментарий'
         verbose_name_plural = 'Комментарии'
+        indexes = [
+            models.Index(
+                fields=['review', '-pub_date'],
+                name='comment_review_pub_date_idx'
+            ),
+        ]
 
     def __str__(self):
         return self.text
@@ -0,0 +1,21 @@
+from django.db.models import Avg, Count
+from django.db.models.signals import post_delete, post_save
+from django.dispatch import receiver
+
+from .models import Review, Title
+
+
+@receiver(post_save, sender=Review)
+@receiver(post_delete, sender=Review)
+def update_title_rating(sender, instance, **kwargs):
+    """
+    Пересчитывает рейтинг и количество отзывов произведения.\n
+    При каскадном удалении произведения пересчет выполняется
+    для каждого удаляемого отзыва: это один агрегирующий запрос
+    и один UPDATE на отзыв.
+    """
+    stats = Review.objects.filter(title_id=instance.title_id).aggregate(
+        rating=Avg('score'),
+        reviews_count=Count('id')
+    )
+    Title.objects.filter(pk=instance.title_id).update(**stats)
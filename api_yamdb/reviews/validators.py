@@ -1,10 +1,29 @@
 import datetime
+import time
 
 from django.core.exceptions import ValidationError
 
+_YEAR_CACHE = {'year': 0, 'expires': 0.0}
+
+
+def current_year():
+    """
+    Возвращает текущий год.\n
+    Значение кешируется до начала следующего года,
+    чтобы не создавать объект даты при каждой проверке.
+    """
+    now = time.time()
+    if now >= _YEAR_CACHE['expires']:
+        year = datetime.date.fromtimestamp(now).year
+        _YEAR_CACHE['year'] = year
+        _YEAR_CACHE['expires'] = time.mktime(
+            datetime.date(year + 1, 1, 1).timetuple()
+        )
+    return _YEAR_CACHE['year']
+
 
 def year_validator(value):
-    if value > datetime.datetime.now().year:
+    if value > current_year():
         raise ValidationError(
             f'{value} год не может быть больше текущего года!',
             params={'value': value},
@@ -1,6 +1,8 @@
 from http import HTTPStatus
 
 import pytest
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
 
 from tests.utils import (check_name_and_slug_patterns, check_pagination,
                          check_permissions, create_categories)
@@ -139,3 +141,83 @@ class Test02CategoryAPI:
                           HTTPStatus.FORBIDDEN)
         check_permissions(moderator_client, url, data, 'модератора',
                           categories, HTTPStatus.FORBIDDEN)
+
+    def test_06_category_list_cache_invalidation(self, client, admin_client,
+                                                 settings,
+                                                 django_assert_num_queries):
+        settings.LOOKUP_LIST_CACHE = True
+        url = '/api/v1/categories/'
+        categories = create_categories(admin_client)
+        response = client.get(url)
+        assert response.json()['count'] == len(categories), (
+            f'Проверьте, что GET-запрос к `{url}` возвращает все объекты.'
+        )
+        with django_assert_num_queries(0):
+            response = client.get(url)
+        assert response.json()['count'] == len(categories), (
+            f'Проверьте, что повторный GET-запрос к `{url}` '
+            'возвращает список из кеша.'
+        )
+
+        admin_client.post(url, data={'name': 'Новый', 'slug': 'new'})
+        response = client.get(url)
+        assert response.json()['count'] == len(categories) + 1, (
+            f'Проверьте, что после POST-запроса к `{url}` список '
+            'в ответе на GET-запрос обновляется.'
+        )
+
+        admin_client.delete(f'{url}{categories[0]["slug"]}/')
+        response = client.get(url)
+        assert response.json()['count'] == len(categories), (
+            f'Проверьте, что после DELETE-запроса к `{url}{{slug}}/` '
+            'список в ответе на GET-запрос обновляется.'
+        )
+
+    def test_07_category_pagination(self, client, admin_client):
+        url = '/api/v1/categories/'
+        data = client.get(url).json()
+        assert data['count'] == 0 and data['results'] == [], (
+            f'Проверьте, что GET-запрос к `{url}` для пустого списка '
+            'категорий возвращает `count`, равный 0, и пустой `results`.'
+        )
+        assert data['next'] is None and data['previous'] is None, (
+            f'Проверьте, что GET-запрос к `{url}` для пустого списка '
+            'категорий не содержит ссылок на другие страницы.'
+        )
+
+        create_categories(admin_client)
+        with CaptureQueriesContext(connection) as context:
+            data = client.get(url).json()
+        queries = [query['sql'].upper() for query in context.captured_queries]
+        assert not any('COUNT(' in query for query in queries), (
+            f'Проверьте, что GET-запрос к `{url}` не выполняет COUNT-запрос, '
+            'если все категории помещаются на первую страницу.'
+        )
+        assert data['count'] == 2 and data['next'] is None, (
+            f'Проверьте, что GET-запрос к `{url}` возвращает корректное '
+            'значение `count` для неполной первой страницы.'
+        )
+
+        for idx in range(5):
+            admin_client.post(
+                url, data={'name': f'Категория {idx}', 'slug': f'cat-{idx}'}
+            )
+        data = client.get(url).json()
+        assert data['count'] == 7 and len(data['results']) == 5, (
+            f'Проверьте, что GET-запрос к `{url}` возвращает корректное '
+            'значение `count` и полную первую страницу.'
+        )
+        assert data['next'], (
+            f'Проверьте, что полная первая страница ответа на GET-запрос к '
+            f'`{url}` содержит ссылку на следующую страницу.'
+        )
+
+        data = client.get(f'{url}?page=2').json()
+        assert data['count'] == 7 and len(data['results']) == 2, (
+            f'Проверьте, что GET-запрос к `{url}?page=2` возвращает '
+            'оставшиеся категории.'
+        )
+        assert data['next'] is None and data['previous'], (
+            f'Проверьте, что последняя страница ответа на GET-запрос к '
+            f'`{url}` содержит ссылку только на предыдущую страницу.'
+        )
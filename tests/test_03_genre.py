@@ -122,3 +122,34 @@ class Test03GenreAPI:
                           HTTPStatus.FORBIDDEN)
         check_permissions(moderator_client, url, data, 'модератора',
                           genres, HTTPStatus.FORBIDDEN)
+
+    def test_06_genre_list_cache_invalidation(self, client, admin_client,
+                                              settings,
+                                              django_assert_num_queries):
+        settings.LOOKUP_LIST_CACHE = True
+        url = '/api/v1/genres/'
+        genres = create_genre(admin_client)
+        response = client.get(url)
+        assert response.json()['count'] == len(genres), (
+            f'Проверьте, что GET-запрос к `{url}` возвращает все объекты.'
+        )
+        with django_assert_num_queries(0):
+            response = client.get(url)
+        assert response.json()['count'] == len(genres), (
+            f'Проверьте, что повторный GET-запрос к `{url}` '
+            'возвращает список из кеша.'
+        )
+
+        admin_client.post(url, data={'name': 'Новый', 'slug': 'new'})
+        response = client.get(url)
+        assert response.json()['count'] == len(genres) + 1, (
+            f'Проверьте, что после POST-запроса к `{url}` список '
+            'в ответе на GET-запрос обновляется.'
+        )
+
+        admin_client.delete(f'{url}{genres[0]["slug"]}/')
+        response = client.get(url)
+        assert response.json()['count'] == len(genres), (
+            f'Проверьте, что после DELETE-запроса к `{url}{{slug}}/` '
+            'список в ответе на GET-запрос обновляется.'
+        )
@@ -172,6 +172,12 @@ class Test04TitleAPI:
             'фильтрации по полю `year` с использованием года выхода '
             'произведения.'
         )
+        for invalid_year in ('abc', '²'):
+            response = admin_client.get(f'{url}?year={invalid_year}')
+            assert response.status_code == HTTPStatus.BAD_REQUEST, (
+                f'Проверьте, что GET-запрос к `{url}` с некорректным '
+                'значением параметра `year` возвращает ответ со статусом 400.'
+            )
         response = admin_client.get(f'{url}?name={post_data_1["name"]}')
         data = response.json()
         assert len(data['results']) == 1, (
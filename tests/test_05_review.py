@@ -384,3 +384,65 @@ class Test05ReviewAPI:
                 f'Проверьте, что DELETE-запрос {role} к чужому отзыву через '
                 f'`{url_template}` удаляет отзыв.'
             )
+
+    def test_06_title_rating_updates(self, admin_client, user_client):
+        titles, _, _ = create_titles(admin_client)
+        title_url = f'/api/v1/titles/{titles[0]["id"]}/'
+        reviews_url = f'{title_url}reviews/'
+
+        create_single_review(admin_client, titles[0]['id'], 'Отлично', 10)
+        response = create_single_review(
+            user_client, titles[0]['id'], 'Неплохо', 6
+        )
+        review_id = response.json()['id']
+        assert admin_client.get(title_url).json().get('rating') == 8, (
+            'Проверьте, что после создания отзыва поле `rating` '
+            'произведения равно средней оценке отзывов.'
+        )
+
+        user_client.patch(f'{reviews_url}{review_id}/', data={'score': 4})
+        assert admin_client.get(title_url).json().get('rating') == 7, (
+            'Проверьте, что после изменения оценки отзыва поле `rating` '
+            'произведения пересчитывается.'
+        )
+
+        user_client.delete(f'{reviews_url}{review_id}/')
+        assert admin_client.get(title_url).json().get('rating') == 10, (
+            'Проверьте, что после удаления отзыва поле `rating` '
+            'произведения пересчитывается.'
+        )
+
+        response = admin_client.get(reviews_url)
+        admin_review_id = response.json()['results'][0]['id']
+        admin_client.delete(f'{reviews_url}{admin_review_id}/')
+        assert admin_client.get(title_url).json().get('rating') is None, (
+            'Проверьте, что у произведения без отзывов поле `rating` '
+            'равно `None`.'
+        )
+
+    def test_07_title_delete_with_reviews(self, admin_client, user_client):
+        titles, _, _ = create_titles(admin_client)
+        title_url = f'/api/v1/titles/{titles[0]["id"]}/'
+        create_single_review(admin_client, titles[0]['id'], 'Отлично', 10)
+        create_single_review(user_client, titles[0]['id'], 'Неплохо', 6)
+
+        response = admin_client.delete(title_url)
+        assert response.status_code == HTTPStatus.NO_CONTENT, (
+            'Проверьте, что DELETE-запрос администратора к произведению '
+            'с отзывами возвращает ответ со статусом 204.'
+        )
+        response = admin_client.get(f'{title_url}reviews/')
+        assert response.status_code == HTTPStatus.NOT_FOUND, (
+            'Проверьте, что при удалении произведения удаляются '
+            'и его отзывы.'
+        )
+
+        response = create_single_review(
+            user_client, titles[1]['id'], 'Хорошо', 8
+        )
+        assert admin_client.get(
+            f'/api/v1/titles/{titles[1]["id"]}/'
+        ).json().get('rating') == 8, (
+            'Проверьте, что после удаления другого произведения рейтинг '
+            'пересчитывается при создании отзыва.'
+        )
@@ -381,3 +381,41 @@ class Test06CommentAPI:
             'Проверьте, что DELETE-запрос неавторизованного пользователя к '
             f'`{url}` возвращает ответ со статусом 401.'
         )
+
+    def test_07_comments_cursor_pagination(self, admin_client, admin, client):
+        reviews, titles = create_reviews(admin_client, {admin: admin_client})
+        url = (
+            f'/api/v1/titles/{titles[0]["id"]}/reviews/'
+            f'{reviews[0]["id"]}/comments/'
+        )
+        texts = [f'comment {idx}' for idx in range(7)]
+        for text in texts:
+            create_single_comment(
+                admin_client, titles[0]['id'], reviews[0]['id'], text
+            )
+
+        data = client.get(url).json()
+        assert data['count'] == len(texts), (
+            f'Проверьте, что первая страница ответа на GET-запрос к `{url}` '
+            'содержит общее количество комментариев в ключе `count`.'
+        )
+        assert data['next'] and data['previous'] is None, (
+            f'Проверьте, что первая страница ответа на GET-запрос к `{url}` '
+            'содержит ссылку на следующую страницу.'
+        )
+        first_page = [comment['text'] for comment in data['results']]
+
+        data = client.get(data['next']).json()
+        assert data['count'] is None, (
+            f'Проверьте, что на следующих страницах ответа на GET-запрос к '
+            f'`{url}` ключ `count` равен `None`.'
+        )
+        assert data['next'] is None and data['previous'], (
+            f'Проверьте, что последняя страница ответа на GET-запрос к '
+            f'`{url}` содержит ссылку только на предыдущую страницу.'
+        )
+        second_page = [comment['text'] for comment in data['results']]
+        assert first_page + second_page == texts[::-1], (
+            f'Проверьте, что страницы ответа на GET-запрос к `{url}` '
+            'содержат все комментарии без повторов, начиная с новых.'
+        )